@@ -22,6 +22,7 @@ import hashlib
 import logging
 
 import bpy
+import numpy as np
 from bpy.app.handlers import persistent
 from bpy.types import (
     AddonPreferences,
@@ -149,19 +150,18 @@ class SEQUENCER_EditBreakdown_Shot(PropertyGroup):
     @property
     def duration_seconds(self):
         """The duration of this shot, in seconds"""
-        fps = bpy.context.scene.render.fps / bpy.context.scene.render.fps_base
+        fps = utils.get_fps(bpy.context.scene)
         return round(self.frame_count / fps, 1)
 
     def count_bits_in_flag(self, prop_id):
         """The total number of options chosen in a multiple choice property."""
         value = self.get_prop_value(prop_id)
-        prop_rna = self.rna_type.properties[prop_id]
+        num_options = len(self.rna_type.properties[prop_id].enum_items)
 
-        count = 0
-        for item in prop_rna.enum_items:
-            if int(item.identifier) & value:
-                count += 1
-        return count, len(prop_rna.enum_items)
+        # Enum items are registered as consecutive powers of 2 starting at 1 (see
+        # register_custom_prop), so the chosen options are the set bits within that range.
+        count = bin(value & ((1 << num_options) - 1)).count("1")
+        return count, num_options
 
     @classmethod
     def has_prop(cls, prop_id: str) -> bool:
@@ -299,10 +299,10 @@ class SEQUENCER_EditBreakdown_Data(PropertyGroup):
     @property
     def total_frames(self):
         """The total number of frames in the edit, including overlapping frames"""
-        num_frames = 0
-        for shot in self.shots:
-            num_frames += shot.frame_count
-        return num_frames
+        # Read all frame counts in one bulk RNA access instead of one access per shot.
+        frame_counts = np.empty(len(self.shots), dtype=np.int32)
+        self.shots.foreach_get("frame_count", frame_counts)
+        return int(frame_counts.sum())
 
     def find_scene(self, scene_uuid: str) -> SEQUENCER_EditBreakdown_Scene:
         """Returns the edit scene matching the given UUID"""
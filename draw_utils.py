@@ -24,6 +24,7 @@ import bgl
 import blf
 import bpy
 import gpu
+import numpy as np
 from gpu_extras.batch import batch_for_shader
 
 log = logging.getLogger(__name__)
@@ -52,9 +53,6 @@ ucolor_lines_rect_batch = batch_for_shader(
 )
 
 image_2d_shader = gpu.shader.from_builtin('2D_IMAGE')
-image_2d_batch = batch_for_shader(
-    image_2d_shader, 'TRI_FAN', {"pos": rect_coords, "texCoord": rect_coords}
-)
 
 
 def draw_background(size):
@@ -113,23 +111,37 @@ def draw_boolean_tag(position, size, color):
     bgl.glDisable(bgl.GL_BLEND)
 
 
-def draw_thumbnails(thumbnail_images, size):
+def create_thumbnail_batches(pos_x, pos_y, size):
+    """Create a batch per thumbnail, with the rectangle already at its position and size"""
 
-    bgl.glActiveTexture(bgl.GL_TEXTURE0)
+    # Offset the scaled rectangle corners by each thumbnail position: (num_thumbnails, 4, 2).
+    corners = np.array(rect_coords, dtype=np.float32) * np.array(size, dtype=np.float32)
+    positions = np.stack((pos_x, pos_y), axis=1).astype(np.float32)
+    vertices = positions[:, None, :] + corners[None, :, :]
 
-    for img in thumbnail_images:
-        # Bind the image texture.
-        bgl.glBindTexture(bgl.GL_TEXTURE_2D, img.id_image.bindcode)
+    return [
+        batch_for_shader(image_2d_shader, 'TRI_FAN', {"pos": rect, "texCoord": rect_coords})
+        for rect in vertices
+    ]
+
+
+def draw_thumbnails(thumbnail_images, thumbnail_batches):
 
-        # Push the position and image size (pop when out of scope).
-        with gpu.matrix.push_pop():
-            gpu.matrix.translate(img.pos)
-            gpu.matrix.scale(size)
+    if len(thumbnail_images) != len(thumbnail_batches):
+        raise ValueError(
+            f"Got {len(thumbnail_batches)} thumbnail batches for {len(thumbnail_images)} images"
+        )
 
-            # Bind the image shader and render
-            image_2d_shader.bind()
-            image_2d_shader.uniform_int("image", 0)
-            image_2d_batch.draw(image_2d_shader)
+    bgl.glActiveTexture(bgl.GL_TEXTURE0)
+
+    # Bind the image shader once for all thumbnails.
+    image_2d_shader.bind()
+    image_2d_shader.uniform_int("image", 0)
+
+    for img, batch in zip(thumbnail_images, thumbnail_batches):
+        # Bind the image texture and render
+        bgl.glBindTexture(bgl.GL_TEXTURE_2D, img.id_image.bindcode)
+        batch.draw(image_2d_shader)
 
 
 # Font ####################################################################
@@ -42,14 +42,14 @@ else:
 
 
 def draw_sequencer_header_extension_left(self, context):
-    if not view.is_thumbnail_view():
+    if not view.is_thumbnail_view(context):
         return
     layout = self.layout
     layout.prop(context.scene.edit_breakdown, "view_grouped_by_scene", text="Group by Scene")
 
 
 def draw_sequencer_header_extension_right(self, context):
-    if not view.is_thumbnail_view():
+    if not view.is_thumbnail_view(context):
         return
     layout = self.layout
     layout.operator("edit_breakdown.sync_edit_breakdown", icon='SEQ_SPLITVIEW')  # FILE_REFRESH
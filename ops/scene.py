@@ -104,7 +104,7 @@ class SEQUENCER_OT_del_scene_all(Operator):
         # Delete all edit scenes
         edit_breakdown.scenes.clear()
         # Refresh the view in case it was grouped by scene
-        view.fit_thumbnails_in_region()
+        view.invalidate_layout()
         return {'FINISHED'}
 
 
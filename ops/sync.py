@@ -28,6 +28,7 @@ import time
 import uuid
 
 import bpy
+import numpy as np
 from bpy.types import Operator
 from bpy.props import BoolProperty
 
@@ -72,15 +73,8 @@ class SEQUENCER_OT_sync_edit_breakdown(Operator):
             rd.image_settings.file_format = orig_file_format
             rd.image_settings.quality = orig_quality
 
-    def save_render(self, datablock, file_name):
-        """Save the current render image to disk"""
-
-        addon_prefs = bpy.context.preferences.addons['edit_breakdown'].preferences
-        folder_name = addon_prefs.edit_shots_folder
-
-        # Ensure folder exists
-        folder_path = pathlib.Path(folder_name)
-        folder_path.mkdir(parents=True, exist_ok=True)
+    def save_render(self, datablock, folder_path, file_name):
+        """Save the current render image to disk, in an existing folder"""
 
         path = folder_path.joinpath(file_name)
         datablock.save_render(str(path))
@@ -107,7 +101,10 @@ class SEQUENCER_OT_sync_edit_breakdown(Operator):
         # Clear the previous runtime data.
         view.thumbnail_images.clear()
         view.thumbnail_size = (0, 0)
+        view.thumbnail_batches = []
+        view.original_image_size = (0, 0)
         view.hovered_thumbnail_idx = -1
+        view.invalidate_layout()
 
         # Ensure the thumbnails folder exists and clear old thumbnails.
         addon_prefs = bpy.context.preferences.addons['edit_breakdown'].preferences
@@ -125,7 +122,7 @@ class SEQUENCER_OT_sync_edit_breakdown(Operator):
                 scene.frame_current = self.get_thumbnail_frame(strip)
                 bpy.ops.render.render()
                 file_name = f'{str(scene.frame_current)}.jpg'
-                self.save_render(bpy.data.images['Render Result'], file_name)
+                self.save_render(bpy.data.images['Render Result'], folder_path, file_name)
         log.info(f"Thumbnails generated in {(time.time() - time_start):.2f}s")
 
         # Load data from the sequence strips marked for use in the edit breakdown
@@ -163,22 +160,23 @@ class SEQUENCER_OT_sync_edit_breakdown(Operator):
                 log.debug(f"Deleting shot {i} - {shot.name}")
                 shots.remove(i)
 
-        # Sort shots per frame number. (Insertion Sort)
-        for i in range(1, len(shots)):  # Start at 1, because 0 is trivially sorted.
-            value_being_sorted = shots[i].frame_start
-            # Shuffle 'value_being_sorted' from right-to-left on the sorted part
-            # of the array, until it reaches its place
-            insert_pos = i - 1
-            while insert_pos >= 0 and shots[insert_pos].frame_start > value_being_sorted:
-                shots.move(insert_pos, insert_pos + 1)
-                insert_pos -= 1
+        # Sort shots per frame number.
+        # Compute the sorted order at once, then move each shot directly into its place, keeping
+        # track of the current order of the collection, so there is at most one move per shot.
+        frame_starts = np.empty(len(shots), dtype=np.int32)
+        shots.foreach_get("frame_start", frame_starts)
+        sorted_order = np.argsort(frame_starts, kind='stable')
+        current_order = list(range(len(shots)))
+        for sorted_pos, shot_idx in enumerate(sorted_order):
+            current_pos = current_order.index(shot_idx, sorted_pos)
+            if current_pos != sorted_pos:
+                shots.move(current_pos, sorted_pos)
+                current_order.insert(sorted_pos, current_order.pop(current_pos))
 
         # Update the thumbnails view
         view.load_edit_thumbnails()
         tools.update_selected_shot(scene)
-
-        # Position the images according to the available space.
-        view.fit_thumbnails_in_region()
+        # Note: loading the thumbnails invalidated their layout, the next redraw positions them.
 
         log.info(f"Syncing done in {(time.time() - time_start):.2f}s")
         return {'FINISHED'}
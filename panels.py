@@ -29,6 +29,11 @@ from . import utils
 from . import view
 
 
+# Formatted text of the Overview and Shot panels. Only rebuilt when the values they show change.
+overview_labels = {"key": None, "lines": ()}
+shot_labels = {"key": None, "lines": ()}
+
+
 class SEQUENCER_PT_edit_breakdown_overview(Panel):
     bl_label = "Overview"
     bl_category = "Edit Breakdown - Shot"
@@ -37,7 +42,7 @@ class SEQUENCER_PT_edit_breakdown_overview(Panel):
 
     @classmethod
     def poll(cls, context):
-        return context.space_data.type == 'SEQUENCE_EDITOR' and view.is_thumbnail_view()
+        return context.space_data.type == 'SEQUENCE_EDITOR' and view.is_thumbnail_view(context)
 
     def draw(self, context):
         layout = self.layout
@@ -45,11 +50,23 @@ class SEQUENCER_PT_edit_breakdown_overview(Panel):
         layout.use_property_decorate = False
 
         edit_breakdown = context.scene.edit_breakdown
+        num_scenes = len(edit_breakdown.scenes)
+        num_shots = len(edit_breakdown.shots)
+        total_frames = edit_breakdown.total_frames
+        key = (num_scenes, num_shots, total_frames, utils.get_fps(context.scene))
+        if overview_labels["key"] != key:
+            overview_labels["key"] = key
+            overview_labels["lines"] = (
+                f"{num_scenes}",
+                f"{num_shots}",
+                *utils.frame_prop_strings(total_frames),
+            )
+        scenes_text, shots_text, duration_timestamp, duration_frames = overview_labels["lines"]
 
         col = layout.column(align=True)
-        utils.draw_stat_label(col, "Scenes", f"{len(edit_breakdown.scenes)}")
-        utils.draw_stat_label(col, "Shots", f"{len(edit_breakdown.shots)}")
-        utils.draw_frame_prop(col, "Duration", edit_breakdown.total_frames)
+        utils.draw_stat_label(col, "Scenes", scenes_text)
+        utils.draw_stat_label(col, "Shots", shots_text)
+        utils.draw_frame_label(col, "Duration", duration_timestamp, duration_frames)
 
 
 class SEQUENCER_PT_edit_breakdown_shot(Panel):
@@ -60,7 +77,7 @@ class SEQUENCER_PT_edit_breakdown_shot(Panel):
 
     @classmethod
     def poll(cls, context):
-        return context.space_data.type == 'SEQUENCE_EDITOR' and view.is_thumbnail_view()
+        return context.space_data.type == 'SEQUENCE_EDITOR' and view.is_thumbnail_view(context)
 
     def draw(self, context):
         layout = self.layout
@@ -82,9 +99,19 @@ class SEQUENCER_PT_edit_breakdown_shot(Panel):
         col.prop(selected_shot, "name")
 
         # Display frame information with a timestamp.
+        frame_start = selected_shot.frame_start
+        frame_count = selected_shot.frame_count
+        key = (sel_idx, frame_start, frame_count, utils.get_fps(context.scene))
+        if shot_labels["key"] != key:
+            shot_labels["key"] = key
+            shot_labels["lines"] = (
+                utils.frame_prop_strings(frame_start),
+                utils.frame_prop_strings(frame_count),
+            )
+        start_text, duration_text = shot_labels["lines"]
         sub = col.column(align=True)
-        utils.draw_frame_prop(sub, "Start Frame", selected_shot.frame_start)
-        utils.draw_frame_prop(sub, "Duration", selected_shot.frame_count)
+        utils.draw_frame_label(sub, "Start Frame", *start_text)
+        utils.draw_frame_label(sub, "Duration", *duration_text)
 
         # Scene that this shot belongs to
         eb_scene = edit_breakdown.find_scene(selected_shot.scene_uuid)
@@ -129,7 +156,7 @@ class SEQUENCER_PT_edit_breakdown_scenes(Panel):
 
     @classmethod
     def poll(cls, context):
-        return context.space_data.type == 'SEQUENCE_EDITOR' and view.is_thumbnail_view()
+        return context.space_data.type == 'SEQUENCE_EDITOR' and view.is_thumbnail_view(context)
 
     def draw(self, context):
         layout = self.layout
@@ -174,7 +201,7 @@ class SEQUENCER_PT_edit_breakdown_shot_custom_props(Panel):
 
     @classmethod
     def poll(cls, context):
-        return context.space_data.type == 'SEQUENCE_EDITOR' and view.is_thumbnail_view()
+        return context.space_data.type == 'SEQUENCE_EDITOR' and view.is_thumbnail_view(context)
 
     def draw(self, context):
         layout = self.layout
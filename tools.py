@@ -21,6 +21,7 @@
 import logging
 
 import bpy
+import numpy as np
 from bpy.app.handlers import persistent
 from bpy.types import (
     Operator,
@@ -44,16 +45,15 @@ log = logging.getLogger(__name__)
 def set_hovered_thumbnail(mouse_x, mouse_y):
     """Determine the thumbnail under the mouse coordinates and set it as hovered"""
 
-    view.hovered_thumbnail_idx = -1
-    for idx, thumb in enumerate(view.thumbnail_images):
-        if (
-            mouse_x >= thumb.pos[0]
-            and mouse_x <= thumb.pos[0] + view.thumbnail_size[0]
-            and mouse_y >= thumb.pos[1]
-            and mouse_y <= thumb.pos[1] + view.thumbnail_size[1]
-        ):
-            view.hovered_thumbnail_idx = idx
-            return
+    pos_x = view.thumbnail_pos_x
+    pos_y = view.thumbnail_pos_y
+    hovered = np.flatnonzero(
+        (mouse_x >= pos_x)
+        & (mouse_x <= pos_x + view.thumbnail_size[0])
+        & (mouse_y >= pos_y)
+        & (mouse_y <= pos_y + view.thumbnail_size[1])
+    )
+    view.hovered_thumbnail_idx = int(hovered[0]) if hovered.size else -1
 
 
 def select_shot(scene, new_selected_thumbnail_idx):
@@ -27,11 +27,17 @@ import sys
 import bpy
 
 
+def get_fps(scene: bpy.types.Scene) -> float:
+    """Returns the frame rate of the given scene"""
+
+    render = scene.render
+    return render.fps / render.fps_base
+
+
 def timestamp_str(num_frames: int) -> str:
     """Returns an absolute frame or duration as a timestamp string"""
 
-    scene = bpy.context.scene
-    fps = scene.render.fps / scene.render.fps_base
+    fps = get_fps(bpy.context.scene)
     sign = "-" if num_frames < 0 else ""
     num_frames = abs(num_frames)
 
@@ -43,16 +49,22 @@ def timestamp_str(num_frames: int) -> str:
     return f"{sign}{h:02d}:{m:02d}:{s:02d}.{ms:03d}"
 
 
-def draw_frame_prop(layout: bpy.types.UILayout, prop_label: str, prop_value: int):
-    """Add a property to Blender's UI, showing timestamp and number of frames"""
+def frame_prop_strings(num_frames: int) -> tuple:
+    """Returns the timestamp and number of frames text to show with draw_frame_label()"""
+
+    return timestamp_str(num_frames), f"{num_frames} "
+
+
+def draw_frame_label(layout: bpy.types.UILayout, label: str, timestamp: str, num_frames: str):
+    """Add already formatted frame information to Blender's UI, aligned as a split property"""
 
     split = layout.split(factor=0.4, align=True)
     split.alignment = 'RIGHT'
-    split.label(text=prop_label)
+    split.label(text=label)
     split = split.split(factor=0.75, align=True)
-    split.label(text=timestamp_str(prop_value))
+    split.label(text=timestamp)
     split.alignment = 'RIGHT'
-    split.label(text=f"{prop_value} ")
+    split.label(text=num_frames)
 
 
 def draw_stat_label(layout: bpy.types.UILayout, label: str, value: str):
@@ -24,9 +24,11 @@ import os
 
 import blf
 import bpy
+import numpy as np
 from bpy_extras.image_utils import load_image
 
 from . import draw_utils
+from . import utils
 
 log = logging.getLogger(__name__)
 
@@ -37,9 +39,10 @@ log = logging.getLogger(__name__)
 class ThumbnailImage:
     """Displayed thumbnail data"""
 
+    __slots__ = ('id_image', 'name', 'shot_idx', 'group_idx', 'pos_in_group')
+
     def __init__(self):
         self.id_image = None  # A Blender ID Image, which can be rendered by bgl.
-        self.pos = (0, 0)  # Position in px where the image should be displayed within a region.
         self.name = ""
         self.shot_idx = -1
         self.group_idx = -1
@@ -47,14 +50,18 @@ class ThumbnailImage:
 
 
 thumbnail_images = []  # All the loaded thumbnails for an edit.
+# Position in px where each thumbnail should be displayed within a region, by thumbnail index.
+thumbnail_pos_x = np.zeros(0, dtype=np.float32)
+thumbnail_pos_y = np.zeros(0, dtype=np.float32)
 thumbnail_size = (0, 0)  # The size in px at which the thumbnails should be displayed.
-original_image_size = (0, 0)
+thumbnail_batches = []  # GPU batches with the rectangle of each thumbnail, for the current layout.
+original_image_size = (0, 0)  # Size in px of the thumbnail files, read once when loading them.
 
 hovered_thumbnail_idx = -1
 
 thumbnail_draw_region = (0, 0, 0, 0)  # Rectangle inside a Blender region where the thumbnails draw
 
-group_by_scene_prev = False
+layout_key = None  # The inputs for which the current thumbnail layout was calculated.
 
 
 class ThumbnailGroup:
@@ -71,10 +78,10 @@ class ThumbnailGroup:
 thumbnail_groups = []
 
 
-def calculate_thumbnail_draw_region():
+def calculate_thumbnail_draw_region(context):
 
     # Get size of the region containing the thumbnails.
-    region = bpy.context.region
+    region = context.region
     total_available_w = region.width
     total_available_h = region.height
 
@@ -82,10 +89,9 @@ def calculate_thumbnail_draw_region():
 
     # If the header and side panels render on top of the region, discount their size.
     # The thumbnails should not be occluded by the UI, even if set to transparent.
-    system_prefs = bpy.context.preferences.system
-    transparent_regions = False  # system_prefs.use_region_overlap
+    transparent_regions = False  # context.preferences.system.use_region_overlap
     if transparent_regions:
-        area = bpy.context.area
+        area = context.area
         for r in area.regions:
             if r.type == 'HEADER' and r.height > 1:
                 total_available_h -= r.height
@@ -108,8 +114,19 @@ def load_edit_thumbnails():
     addon_prefs = bpy.context.preferences.addons['edit_breakdown'].preferences
     folder_name = addon_prefs.edit_shots_folder
 
+    # Note: the images are loaded one at a time on the main thread, since load_image() creates
+    # Blender data-blocks, which is not thread-safe.
     try:
-        for filename in os.listdir(folder_name):
+        with os.scandir(folder_name) as dir_entries:
+            thumbnail_files = [entry.name for entry in dir_entries if entry.is_file()]
+        # Thumbnails are named after the frame they show. Load them in frame order.
+        frames = np.fromiter(
+            (int(filename.partition('.')[0]) for filename in thumbnail_files),
+            dtype=np.int32,
+            count=len(thumbnail_files),
+        )
+        for file_idx in np.argsort(frames, kind='stable'):
+            filename = thumbnail_files[file_idx]
             img = ThumbnailImage()
             img.id_image = load_image(
                 filename,
@@ -124,44 +141,124 @@ def load_edit_thumbnails():
                 force_reload=False,
             )
             thumbnail_images.append(img)
-            img.name = int(filename.split('.')[0])
+            img.name = int(frames[file_idx])
     except FileNotFoundError:
         # self.report({'ERROR'}, # Need an operator
-        log.warning(f"Reading thumbnail images from '{folder_name}' failed: folder does not exist.")
+        log.warning(
+            "Reading thumbnail images from '%s' failed: folder does not exist.", folder_name
+        )
 
-    thumbnail_images.sort(key=lambda x: x.name, reverse=False)
+    # The positions and batches of any previous layout don't match the new images.
+    global thumbnail_pos_x, thumbnail_pos_y, thumbnail_batches
+    thumbnail_pos_x = np.zeros(len(thumbnail_images), dtype=np.float32)
+    thumbnail_pos_y = np.zeros(len(thumbnail_images), dtype=np.float32)
+    thumbnail_batches = []
 
     for i, img in enumerate(thumbnail_images):
         img.shot_idx = i
         if img.id_image.gl_load():
             raise Exception()
 
+    # Copy the size out of Blender's image, so that the layout doesn't access it on every fit.
     global original_image_size
     try:
-        original_image_size = thumbnail_images[0].id_image.size
-    except ValueError:
-        original_image_size = (100,100)
+        original_image_size = tuple(thumbnail_images[0].id_image.size)
+    except IndexError:
+        original_image_size = (100, 100)
+
+    log.info("Loaded %d images.", len(thumbnail_images))
+    invalidate_layout()
+    image_aspect_ratio = original_image_size[0] / original_image_size[1]
+    log.debug(
+        "Image a.ratio=%.2f (%dx%d)",
+        image_aspect_ratio,
+        original_image_size[0],
+        original_image_size[1],
+    )
 
-    log.info(f"Loaded {len(thumbnail_images)} images.")
 
+def invalidate_layout():
+    """Force the thumbnail layout to be recalculated by the next fit_thumbnails_in_region()"""
+    global layout_key
+    layout_key = None
+
+
+def fit_thumbnails_in_region(context):
+    """Calculate the thumbnails' size and where to render each one so they fit the given region
 
-def fit_thumbnails_in_region():
-    """Calculate the thumbnails' size and where to render each one so they fit the given region"""
+    The layout is only recalculated if the available space, the number of images or the
+    grouping changed since the last time. Use invalidate_layout() to force an update.
+    """
 
     # If there are no images to fit, we're done!
-    edit_breakdown = bpy.context.scene.edit_breakdown
+    edit_breakdown = context.scene.edit_breakdown
     shots = edit_breakdown.shots
     if not shots or not thumbnail_images:
         return
 
+    # Skip recalculating a layout that would be the same as the current one.
+    global layout_key
+    group_by_scene = edit_breakdown.view_grouped_by_scene and bool(edit_breakdown.scenes)
+    key = (thumbnail_draw_region, len(thumbnail_images), group_by_scene)
+    if key == layout_key:
+        return
+    layout_key = key
+
     log.debug("------Fit Images-------------------")
 
-    if edit_breakdown.view_grouped_by_scene and edit_breakdown.scenes:
-        fit_thumbnails_in_group()
+    if group_by_scene:
+        fit_thumbnails_in_group(context)
     else:
         thumbnail_groups.clear()
         fit_thumbnails_in_grid()
 
+    # Upload the new thumbnail rectangles, so drawing doesn't need to place each one.
+    # Skip it if the thumbnails are too small to be drawn anyway.
+    global thumbnail_batches
+    if is_thumbnail_size_drawable():
+        thumbnail_batches = draw_utils.create_thumbnail_batches(
+            thumbnail_pos_x, thumbnail_pos_y, thumbnail_size
+        )
+    else:
+        thumbnail_batches = []
+
+
+def is_thumbnail_size_drawable():
+    """True if the current layout makes the thumbnails big enough to be worth rendering"""
+    return thumbnail_size[0] > 5 and thumbnail_size[1] > 5
+
+
+def calculate_spacing(available_space, num_thumbs, min_margin):
+    """Split the space not occupied by thumbnails into a margin and the spacing between them
+
+    Returns (margin, spacing) in px.
+    """
+
+    spacing = 0
+    if num_thumbs > 1:
+        # Spacing between images should never be bigger than the margins
+        spacing = min(math.ceil((available_space - min_margin) / (num_thumbs - 1)), min_margin)
+
+    margin = math.floor((available_space - spacing * (num_thumbs - 1)) / 2)
+    return margin, spacing
+
+
+def log_spacing(remaining_space_w, remaining_space_h, space_w, space_h):
+    """Log the result of calculate_spacing() for both axes"""
+
+    log.debug("remaining space %.2fpx x %.2fpx", remaining_space_w, remaining_space_h)
+    log.debug("margins=(%d, %d)", space_w[0], space_h[0])
+    log.debug("spacing=(%d, %d)", space_w[1], space_h[1])
+
+
+def layout_grid_positions(num_images, start_x, start_y, step_x, step_y, num_images_per_row):
+    """Get the position of each thumbnail of a grid, filled row by row from the top left"""
+
+    idx = np.arange(num_images)
+    col = idx % num_images_per_row
+    row = idx // num_images_per_row
+    return start_x + step_x * col, start_y - step_y * row
+
 
 def fit_thumbnails_in_grid():
     """Calculate the thumbnails' size and where to render each one so they fit the given region
@@ -183,7 +280,7 @@ def fit_thumbnails_in_grid():
     total_available_h = thumbnail_draw_region[3]
     start_w = thumbnail_draw_region[0]
 
-    log.debug(f"Region w:{total_available_w} h:{total_available_h}")
+    log.debug("Region w:%s h:%s", total_available_w, total_available_h)
 
     # Get the available size, discounting white space size.
     total_spacing = (150, 150)
@@ -192,12 +289,10 @@ def fit_thumbnails_in_grid():
     available_h = total_available_h - total_spacing[1]
     max_thumb_size = (total_available_w - min_margin, total_available_h - min_margin)
 
-    # Get the original size and aspect ratio of the images.
+    # Get the original size of the images, as cached when the thumbnails were loaded.
     # Assume all images in the edit have the same aspect ratio.
     original_image_w = original_image_size[0]
     original_image_h = original_image_size[1]
-    image_aspect_ratio = original_image_w / original_image_h
-    log.debug(f"Image a.ratio={image_aspect_ratio:.2f} ({original_image_w}x{original_image_h})")
 
     # Calculate by how much images need to be scaled in order to fit. (won't be perfect)
     available_area = available_w * available_h
@@ -207,7 +302,7 @@ def fit_thumbnails_in_grid():
         thumbnail_size = (0, 0)
         return
     scale_factor = math.sqrt(thumbnail_area / (original_image_w * original_image_h))
-    log.debug(f"Scale factor: {scale_factor:.3f}")
+    log.debug("Scale factor: %.3f", scale_factor)
 
     thumbnail_size = (
         original_image_w * scale_factor,
@@ -215,9 +310,9 @@ def fit_thumbnails_in_grid():
     )
 
     num_images_per_row = math.ceil(available_w / thumbnail_size[0])
-    num_images_per_col = math.ceil(num_images / num_images_per_row)
-    log.debug(f"Thumbnail width  {thumbnail_size[0]:.3f}px, # per row: {num_images_per_row:.3f}")
-    log.debug(f"Thumbnail height {thumbnail_size[1]:.3f}px, # per col: {num_images_per_col:.3f}")
+    num_images_per_col = -(-num_images // num_images_per_row)  # Integer ceil division.
+    log.debug("Thumbnail width  %.3fpx, # per row: %d", thumbnail_size[0], num_images_per_row)
+    log.debug("Thumbnail height %.3fpx, # per col: %d", thumbnail_size[1], num_images_per_col)
 
     # Make sure that both a row and a column of images at the current scale will fit.
     # It is possible that, with few images and a region aspect ratio that is very different from
@@ -227,7 +322,7 @@ def fit_thumbnails_in_grid():
         scale_factor = max_thumb_size[0] / (original_image_w * num_images_per_row)
     if original_image_h * scale_factor * num_images_per_col > max_thumb_size[1]:
         scale_factor = max_thumb_size[1] / (original_image_h * num_images_per_col)
-    log.debug(f"Reduced scale factor: {scale_factor:.3f}")
+    log.debug("Reduced scale factor: %.3f", scale_factor)
 
     thumbnail_size = (
         original_image_w * scale_factor,
@@ -236,52 +331,30 @@ def fit_thumbnails_in_grid():
 
     # Get the remaining space not occupied by thumbnails and split it into margins
     # and spacing between the thumbnails.
-    def calculate_spacing(total_available, thumb_size, num_thumbs):
-
-        available_space = total_available - thumb_size * num_thumbs
-        log.debug(f"remaining space {available_space:.2f}px")
-
-        spacing = 0
-        if num_thumbs > 1:
-            spacing = (available_space - min_margin) / (num_thumbs - 1)
-            log.debug(f"spacing={spacing:.3f}")
-            # Spacing between images should never be bigger than the margins
-            spacing = min(math.ceil(spacing), min_margin)
-
-        margin = (available_space - spacing * (num_thumbs - 1)) / 2
-        log.debug(f"margins={margin:.3f}")
-        margin = math.floor(margin)
-
-        return (margin, spacing)
-
-    log.debug(f"X")
-    space_w = calculate_spacing(total_available_w, thumbnail_size[0], num_images_per_row)
-    log.debug(f"Y")
-    space_h = calculate_spacing(total_available_h, thumbnail_size[1], num_images_per_col)
+    remaining_space_w = total_available_w - thumbnail_size[0] * num_images_per_row
+    remaining_space_h = total_available_h - thumbnail_size[1] * num_images_per_col
+    space_w = calculate_spacing(remaining_space_w, num_images_per_row, min_margin)
+    space_h = calculate_spacing(remaining_space_h, num_images_per_col, min_margin)
+    log_spacing(remaining_space_w, remaining_space_h, space_w, space_h)
 
     margins = (space_w[0], space_h[0])
     spacing = (space_w[1], space_h[1])
 
     # Set the position of each thumbnail
-    start_pos_x = start_w + margins[0]
-    start_pos_y = total_available_h - thumbnail_size[1] - margins[1]
-    last_start_pos_x = start_w + math.ceil(
-        margins[0] + (num_images_per_row - 1) * (thumbnail_size[0] + spacing[0])
+    thumbnail_pos_x[:], thumbnail_pos_y[:] = layout_grid_positions(
+        num_images,
+        float(start_w + margins[0]),
+        float(total_available_h - thumbnail_size[1] - margins[1]),
+        float(thumbnail_size[0] + spacing[0]),
+        float(thumbnail_size[1] + spacing[1]),
+        num_images_per_row,
     )
 
-    for img in thumbnail_images:
-        img.pos = (start_pos_x, start_pos_y)
-        start_pos_x += thumbnail_size[0] + spacing[0]
-        # Next row
-        if start_pos_x > last_start_pos_x:
-            start_pos_x = start_w + margins[0]
-            start_pos_y -= thumbnail_size[1] + spacing[1]
-
 
-def fit_thumbnails_in_group():
+def fit_thumbnails_in_group(context):
     """ """
 
-    edit_breakdown = bpy.context.scene.edit_breakdown
+    edit_breakdown = context.scene.edit_breakdown
     shots = edit_breakdown.shots
     edit_scenes = edit_breakdown.scenes
     num_images = len(thumbnail_images)
@@ -297,6 +370,7 @@ def fit_thumbnails_in_group():
         thumbnail_groups.append(group)
 
     # Assign shots to groups
+    shot_group_idx = np.zeros(len(shots), dtype=np.int32)
     for shot_idx, shot in enumerate(shots):
 
         scene_idx = 0
@@ -304,6 +378,7 @@ def fit_thumbnails_in_group():
             if eb_scene.uuid == shot.scene_uuid:
                 scene_idx = i
                 break
+        shot_group_idx[shot_idx] = scene_idx
         group = thumbnail_groups[scene_idx]
         if group:
             group.shot_ids.append(shot_idx)
@@ -323,7 +398,7 @@ def fit_thumbnails_in_group():
     total_available_h = thumbnail_draw_region[3]
     start_w = thumbnail_draw_region[0]
 
-    log.debug(f"Region w:{total_available_w} h:{total_available_h}")
+    log.debug("Region w:%s h:%s", total_available_w, total_available_h)
 
     # Get the available size, discounting white space size.
     group_titles_height = 22
@@ -336,12 +411,10 @@ def fit_thumbnails_in_group():
         total_available_h - min_margin,
     )
 
-    # Get the original size and aspect ratio of the images.
+    # Get the original size of the images, as cached when the thumbnails were loaded.
     # Assume all images in the edit have the same aspect ratio.
     original_image_w = original_image_size[0]
     original_image_h = original_image_size[1]
-    image_aspect_ratio = original_image_w / original_image_h
-    log.debug(f"Image a.ratio={image_aspect_ratio:.2f} ({original_image_w}x{original_image_h})")
 
     # Calculate by how much images need to be scaled in order to fit. (won't be perfect)
     available_area = available_w * available_h
@@ -351,20 +424,20 @@ def fit_thumbnails_in_group():
         thumbnail_size = (0, 0)
         return
     scale_factor = math.sqrt(thumbnail_area / (original_image_w * original_image_h))
-    log.debug(f"Scale factor: {scale_factor:.3f}")
+    log.debug("Scale factor: %.3f", scale_factor)
     thumbnail_size = (
         original_image_w * scale_factor,
         original_image_h * scale_factor,
     )
 
     num_images_per_row = math.ceil(available_w / thumbnail_size[0])
-    num_images_per_col = math.ceil(num_images / num_images_per_row)
-    log.debug(f"Thumbnail width  {thumbnail_size[0]:.3f}px, # per row: {num_images_per_row:.3f}")
-    log.debug(f"Thumbnail height {thumbnail_size[1]:.3f}px, # per col: {num_images_per_col:.3f}")
+    num_images_per_col = -(-num_images // num_images_per_row)  # Integer ceil division.
+    log.debug("Thumbnail width  %.3fpx, # per row: %d", thumbnail_size[0], num_images_per_row)
+    log.debug("Thumbnail height %.3fpx, # per col: %d", thumbnail_size[1], num_images_per_col)
 
     num_images_per_col = 0
     for group in thumbnail_groups:
-        rows = math.ceil(len(group.shot_ids) / num_images_per_row)
+        rows = -(-len(group.shot_ids) // num_images_per_row)
         print(f"{group.name}, rows: {rows}")
         group.shot_rows = rows
         num_images_per_col += rows
@@ -380,7 +453,7 @@ def fit_thumbnails_in_group():
 
         num_images_per_col = 0
         for group in thumbnail_groups:
-            rows = math.ceil(len(group.shot_ids) / num_images_per_row)
+            rows = -(-len(group.shot_ids) // num_images_per_row)
             print(f"{group.name}, rows: {rows}")
             group.shot_rows = rows
             num_images_per_col += rows
@@ -391,8 +464,8 @@ def fit_thumbnails_in_group():
             f"{num_images_per_col * thumbnail_size[1]} > available space {available_h} ? "
         )
 
-    log.debug(f"Thumbnail width  {thumbnail_size[0]:.3f}px, # per row: {num_images_per_row:.3f}")
-    log.debug(f"Thumbnail height {thumbnail_size[1]:.3f}px, # per col: {num_images_per_col:.3f}")
+    log.debug("Thumbnail width  %.3fpx, # per row: %d", thumbnail_size[0], num_images_per_row)
+    log.debug("Thumbnail height %.3fpx, # per col: %d", thumbnail_size[1], num_images_per_col)
 
     # Make sure that both a row and a column of images at the current scale will fit.
     # It is possible that, with few images and a region aspect ratio that is very different from
@@ -402,7 +475,7 @@ def fit_thumbnails_in_group():
         scale_factor = max_thumb_size[0] / (original_image_w * num_images_per_row)
     # if original_image_h * scale_factor * num_images_per_col > max_thumb_size[1]:
     #    scale_factor = max_thumb_size[1] / (original_image_h * num_images_per_col)
-    log.debug(f"Reduced scale factor: {scale_factor:.3f}")
+    log.debug("Reduced scale factor: %.3f", scale_factor)
 
     thumbnail_size = (
         original_image_w * scale_factor,
@@ -411,33 +484,15 @@ def fit_thumbnails_in_group():
 
     # Get the remaining space not occupied by thumbnails and split it into margins
     # and spacing between the thumbnails.
-    def calculate_spacing(total_available, available_space, num_thumbs):
-
-        log.debug(f"remaining space {available_space:.2f}px")
-
-        spacing = 0
-        if num_thumbs > 1:
-            spacing = (available_space - min_margin) / (num_thumbs - 1)
-            log.debug(f"spacing={spacing:.3f}")
-            # Spacing between images should never be bigger than the margins
-            spacing = min(math.ceil(spacing), min_margin)
-
-        margin = (available_space - spacing * (num_thumbs - 1)) / 2
-        log.debug(f"margins={margin:.3f}")
-        margin = math.floor(margin)
-
-        return (margin, spacing)
-
-    log.debug(f"X")
-    available_space = total_available_w - thumbnail_size[0] * num_images_per_row
-    space_w = calculate_spacing(total_available_w, available_space, num_images_per_row)
-    log.debug(f"Y")
-    available_space = (
+    remaining_space_w = total_available_w - thumbnail_size[0] * num_images_per_row
+    remaining_space_h = (
         total_available_h
         - thumbnail_size[1] * num_images_per_col
         - group_titles_height * len(thumbnail_groups)
     )
-    space_h = calculate_spacing(total_available_h, available_space, num_images_per_col)
+    space_w = calculate_spacing(remaining_space_w, num_images_per_row, min_margin)
+    space_h = calculate_spacing(remaining_space_h, num_images_per_col, min_margin)
+    log_spacing(remaining_space_w, remaining_space_h, space_w, space_h)
 
     margins = (space_w[0], space_h[0])
     spacing = (space_w[1], space_h[1])
@@ -447,18 +502,21 @@ def fit_thumbnails_in_group():
     start_pos_y_thumb = thumbnail_size[1] + 6
     thumbnail_step_x = thumbnail_size[0] + spacing[0]
     thumbnail_step_y = thumbnail_size[1] + spacing[1]
-    last_start_pos_x = start_w + math.ceil(
-        margins[0] + (num_images_per_row - 1) * (thumbnail_size[0] + spacing[0])
+
+    # Get the total duration of each group, summing the frames of all shots in one pass.
+    frame_counts = np.empty(len(shots), dtype=np.int32)
+    shots.foreach_get("frame_count", frame_counts)
+    group_frames = np.bincount(
+        shot_group_idx, weights=frame_counts, minlength=len(thumbnail_groups)
     )
+    fps = utils.get_fps(context.scene)
 
     # Set the position of each group title
     for group_idx, group in enumerate(thumbnail_groups):
         group.name_pos = (start_pos_x, start_pos_y_title)
         start_pos_y_title -= group_titles_height + thumbnail_step_y * group.shot_rows
 
-        duration_s = 0
-        for shot_id in group.shot_ids:
-            duration_s += shots[shot_id].duration_seconds
+        duration_s = group_frames[group_idx] / fps
         group.name += f" (shots: {len(group.shot_ids)}, {duration_s:.1f}s)"
 
         title_font_size = 12
@@ -468,20 +526,21 @@ def fit_thumbnails_in_group():
         print(group.color_rect)
 
     # Set the position of each thumbnail
-    for img in thumbnail_images:
-        row = int(img.pos_in_group / num_images_per_row)
-        col = img.pos_in_group % num_images_per_row
-        group_y = thumbnail_groups[img.group_idx].name_pos[1]
-        img.pos = (
-            start_pos_x + thumbnail_step_x * col,
-            group_y - start_pos_y_thumb - thumbnail_step_y * row,
-        )
-        # print(f"{img.name} : [group/pos]({img.group_idx},{img.pos_in_group})
-        # [row/col]({row},{col}) pos({img.pos[0]:.2f},{img.pos[1]:.2f})")
+    pos_in_group = np.fromiter(
+        (img.pos_in_group for img in thumbnail_images), dtype=np.int32, count=num_images
+    )
+    group_idx = np.fromiter(
+        (img.group_idx for img in thumbnail_images), dtype=np.int32, count=num_images
+    )
+    group_title_y = np.array([group.name_pos[1] for group in thumbnail_groups], dtype=np.float32)
+    col = pos_in_group % num_images_per_row
+    row = pos_in_group // num_images_per_row
+    thumbnail_pos_x[:] = start_pos_x + thumbnail_step_x * col
+    thumbnail_pos_y[:] = group_title_y[group_idx] - start_pos_y_thumb - thumbnail_step_y * row
 
 
-def is_thumbnail_view():
-    """True if the current space has the edit breakdown view enabled.
+def is_thumbnail_view(context):
+    """True if the context's space has the edit breakdown view enabled.
 
     Note: I found no way of making a new space or mode toggle for this
     add-on, therefore, I'm hijacking the Display Channels toggle as it
@@ -491,15 +550,12 @@ def is_thumbnail_view():
     TODO: whenever possible, switch the thumbnail view to its own editor
     space or add a toggle to the region/area/space if they get support
     for ID properties."""
-    return bpy.context.space_data.preview_channels == 'COLOR'
+    return context.space_data.preview_channels == 'COLOR'
 
 
-def draw_edit_thumbnails():
+def draw_edit_thumbnails(context):
     """Render the edit thumbnails"""
 
-    if not is_thumbnail_view():
-        return
-
     # Load the images the first time they're needed.
     if not thumbnail_images:
         load_edit_thumbnails()
@@ -512,21 +568,14 @@ def draw_edit_thumbnails():
     except:
         load_edit_thumbnails()
 
-    # Recalculate the thumbnail positions when the available drawing space changes.
-    prev_draw_region = thumbnail_draw_region
-    calculate_thumbnail_draw_region()
-    if prev_draw_region != thumbnail_draw_region:
-        fit_thumbnails_in_region()
-
-    # Recalculate thumbnail positions if the grouping setting changes
-    global group_by_scene_prev
-    group_by_scene = bpy.context.scene.edit_breakdown.view_grouped_by_scene
-    if group_by_scene_prev != group_by_scene:
-        group_by_scene_prev = group_by_scene
-        fit_thumbnails_in_region()
+    # Recalculate the thumbnail positions when the available drawing space or grouping changes.
+    calculate_thumbnail_draw_region(context)
+    fit_thumbnails_in_region(context)
+    group_by_scene = context.scene.edit_breakdown.view_grouped_by_scene
 
     # If the resulting layout makes the images too small, skip rendering.
-    if thumbnail_size[0] <= 5 or thumbnail_size[1] <= 5:
+    # Also skip it if there is no layout for the current images yet, e.g. if there are no shots.
+    if not is_thumbnail_size_drawable() or not thumbnail_batches:
         return
 
     if group_by_scene:
@@ -539,20 +588,18 @@ def draw_edit_thumbnails():
             draw_utils.draw_boolean_tag(group.color_rect[0:2], group.color_rect[2:4], group.color)
 
     # Render each image.
-    draw_utils.draw_thumbnails(thumbnail_images, thumbnail_size)
+    draw_utils.draw_thumbnails(thumbnail_images, thumbnail_batches)
 
 
-def draw_background():
-    if not is_thumbnail_view():
-        return
-    region = bpy.context.region
+def draw_background(context):
+    region = context.region
     draw_utils.draw_background((region.width, region.height))
 
 
-def draw_tool_active_tag():
+def draw_tool_active_tag(context):
     """Draw the value of the active tag on top of each thumbnail"""
 
-    scene = bpy.context.scene
+    scene = context.scene
     shots = scene.edit_breakdown.shots
     if not shots:
         return
@@ -572,7 +619,7 @@ def draw_tool_active_tag():
 
         return (base_color[0], base_color[1], base_color[2], alpha)
 
-    active_tool = bpy.context.workspace.tools.from_space_sequencer('PREVIEW')
+    active_tool = context.workspace.tools.from_space_sequencer('PREVIEW')
     if active_tool and active_tool.idname == "edit_breakdown.thumbnail_tag_tool":
 
         # Tags show as full-width stripes at the bottom of thumbnails
@@ -600,39 +647,49 @@ def draw_tool_active_tag():
                     log.warning("Active tag enum value is invalid")
                     return
 
-            for img in thumbnail_images:
+            for i, img in enumerate(thumbnail_images):
                 value = int(shots[img.shot_idx].get(tag, tag_default_value))
                 if prop_config.data_type == 'ENUM_FLAG':
                     value = int(value & active_enum_item != 0)
                 elif prop_config.data_type == 'ENUM_VAL':
                     value = int(value == active_enum_item)
                 tag_color = get_color_for_tag(prop_config, value)
-                draw_utils.draw_boolean_tag(img.pos, tag_size, tag_color)
+                pos = (thumbnail_pos_x[i], thumbnail_pos_y[i])
+                draw_utils.draw_boolean_tag(pos, tag_size, tag_color)
 
 
-def draw_overlay():
+def draw_overlay(context):
     """Draw overlay effects on top of the thumbnails"""
 
-    if not is_thumbnail_view():
-        return
-
-    draw_tool_active_tag()
+    draw_tool_active_tag(context)
 
     if hovered_thumbnail_idx != -1:
-        hovered_thumbnail = thumbnail_images[hovered_thumbnail_idx]
-        draw_utils.draw_hover_highlight(hovered_thumbnail.pos, thumbnail_size)
+        pos = (thumbnail_pos_x[hovered_thumbnail_idx], thumbnail_pos_y[hovered_thumbnail_idx])
+        draw_utils.draw_hover_highlight(pos, thumbnail_size)
 
-    active_selected_thumbnail_idx = bpy.context.scene.edit_breakdown.selected_shot_idx
+    active_selected_thumbnail_idx = context.scene.edit_breakdown.selected_shot_idx
     if active_selected_thumbnail_idx != -1:
-        active_selected_thumbnail = thumbnail_images[active_selected_thumbnail_idx]
         size = (thumbnail_size[0] + 2, thumbnail_size[1] + 2)
         pos = (
-            active_selected_thumbnail.pos[0] - 1,
-            active_selected_thumbnail.pos[1] - 1,
+            thumbnail_pos_x[active_selected_thumbnail_idx] - 1,
+            thumbnail_pos_y[active_selected_thumbnail_idx] - 1,
         )
         draw_utils.draw_selected_frame(pos, size)
 
 
+def draw_thumbnail_view():
+    """Draw the edit breakdown view: background, thumbnails and overlay effects"""
+
+    # Resolve the context once and share it between all the drawing steps.
+    context = bpy.context
+    if not is_thumbnail_view(context):
+        return
+
+    draw_background(context)
+    draw_edit_thumbnails(context)
+    draw_overlay(context)
+
+
 # Add-on Registration #############################################################################
 
 draw_handles = []
@@ -641,9 +698,7 @@ space = bpy.types.SpaceSequenceEditor
 
 def register():
 
-    draw_handles.append(space.draw_handler_add(draw_background, (), 'PREVIEW', 'POST_PIXEL'))
-    draw_handles.append(space.draw_handler_add(draw_edit_thumbnails, (), 'PREVIEW', 'POST_PIXEL'))
-    draw_handles.append(space.draw_handler_add(draw_overlay, (), 'PREVIEW', 'POST_PIXEL'))
+    draw_handles.append(space.draw_handler_add(draw_thumbnail_view, (), 'PREVIEW', 'POST_PIXEL'))
     # draw_handles.append(space.draw_handler_add(draw_text, (), 'PREVIEW', 'POST_PIXEL'))
 
 